@@ -4,7 +4,9 @@ Traitlets based configuration for jupyter_server_proxy
 
 from __future__ import annotations
 
+import json
 import sys
+from functools import lru_cache
 from textwrap import dedent, indent
 from warnings import warn
 
@@ -327,29 +329,89 @@ class ServerProcess(Configurable):
         # FIXME: Set 'name' properly
         attributes = self.get_proxy_attributes()
 
+        # Generating a class is not free (namespace dict, MRO computation),
+        # so reuse it when the same configuration comes around again. The
+        # kwargs stay per-call: they carry mutable state.
+        try:
+            key = (cls, _freeze_attribute(attributes))
+        except TypeError:
+            key = None
+        if key is not None and key in _proxy_handler_classes:
+            return _proxy_handler_classes[key], proxy_kwargs
+
         class _Proxy(cls):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
+            # Each generated class gets its own memo for rendered templates,
+            # shared by all requests handled by this server process
+            _render_cache = {}
 
-                for name, value in attributes.items():
-                    setattr(self, name, value)
+            # Rendered environment, stored as a (key, value) pair so a
+            # change in the connection details (e.g. a new port after a
+            # process restart) invalidates it
+            _env_cache = None
 
             def get_request_headers_override(self):
                 return self._realize_rendered_template(self.request_headers_override)
 
             # these two methods are only used in supervise classes, but do no harm otherwise
             def get_env(self):
-                return self._realize_rendered_template(self.environment)
+                if callable(self.environment):
+                    # a callable may return different values on each call
+                    return self._realize_rendered_template(self.environment)
+
+                key = (self.port, self.unix_socket, self.base_url)
+                cache = type(self)._env_cache
+                if cache is None or cache[0] != key:
+                    rendered = self._realize_rendered_template(self.environment)
+                    type(self)._env_cache = cache = (key, rendered)
+                return cache[1]
 
             def get_timeout(self):
                 return self.timeout
 
+        # Bake the configuration in as class attributes: handlers are
+        # instantiated per request and should not pay a setattr loop each
+        # time. Callables are wrapped in staticmethod so the descriptor
+        # protocol does not turn them into bound methods.
+        for name, value in attributes.items():
+            if callable(value):
+                value = staticmethod(value)
+            setattr(_Proxy, name, value)
+
+        if key is not None:
+            _proxy_handler_classes[key] = _Proxy
         return _Proxy, proxy_kwargs
 
 
+def _freeze_attribute(value):
+    """
+    Turn a proxy attribute into a hashable cache key. Dicts and lists become
+    sorted/plain tuples; anything else (including callables) is used as-is
+    and may raise TypeError if unhashable.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_attribute(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze_attribute(v) for v in value)
+    hash(value)
+    return value
+
+
+# Generated handler classes, keyed by base class and frozen attributes
+_proxy_handler_classes = {}
+
+
+@lru_cache(maxsize=None)
+def _server_proxy_entry_points():
+    """
+    Fetch the registered entry points once, as scanning the distributions on
+    sys.path is slow and their set cannot change within a running process.
+    """
+    return tuple(entry_points(group="jupyter_serverproxy_servers"))
+
+
 def get_entrypoint_server_processes():
     processes = []
-    for entry_point in entry_points(group="jupyter_serverproxy_servers"):
+    for entry_point in _server_proxy_entry_points():
         name = entry_point.name
         try:
             server_process_config = entry_point.load()()
@@ -364,18 +426,38 @@ def make_handlers(base_url: str, server_processes: list[ServerProcess]):
     """
     Get tornado handlers for registered server_processes
     """
-    handlers = []
+    # Pre-size the list (two entries per server) and join the prefix once
+    # per server instead of once per entry
+    handlers = [None] * (2 * len(server_processes))
+    i = 0
     for server in server_processes:
         handler, kwargs = server.make_proxy_handler()
         if not handler:
             continue
-        handlers.append((ujoin(base_url, server.name, r"(.*)"), handler, kwargs))
-        handlers.append((ujoin(base_url, server.name), AddSlashHandler))
+        prefix = ujoin(base_url, server.name)
+        handlers[i] = (prefix + r"/(.*)", handler, kwargs)
+        handlers[i + 1] = (prefix, AddSlashHandler)
+        i += 2
+    del handlers[i:]
     return handlers
 
 
+_server_processes = {}
+
+
 def make_server_process(name: str, server_process_config: dict, serverproxy_config):
-    return ServerProcess(name=name, **server_process_config)
+    # Reuse the ServerProcess when the same configuration is requested again,
+    # e.g. on repeated discovery runs. The config dict is snapshotted into a
+    # hashable key; repr covers values like callables that json can't encode,
+    # but non-string dict keys can't be serialized at all, so such configs
+    # skip the cache.
+    try:
+        key = (name, json.dumps(server_process_config, sort_keys=True, default=repr))
+    except TypeError:
+        return ServerProcess(name=name, **server_process_config)
+    if key not in _server_processes:
+        _server_processes[key] = ServerProcess(name=name, **server_process_config)
+    return _server_processes[key]
 
 
 def _serverproxy_servers_help():
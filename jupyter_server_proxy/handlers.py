@@ -9,14 +9,17 @@ import re
 import socket
 from asyncio import Lock
 from copy import copy
+from functools import lru_cache
 from tempfile import mkdtemp
 from urllib.parse import quote, urlparse, urlunparse
+from weakref import WeakKeyDictionary
 
 import aiohttp
 from jupyter_server.base.handlers import JupyterHandler, utcnow
 from jupyter_server.utils import ensure_async, url_path_join
 from simpervisor import SupervisedProcess
 from tornado import httpclient, httputil, web
+from tornado.ioloop import IOLoop
 from tornado.simple_httpclient import SimpleAsyncHTTPClient
 from traitlets import Bytes, Dict, Instance, Integer, Unicode, Union, default, observe
 from traitlets.traitlets import HasTraits
@@ -85,6 +88,68 @@ class RewritableResponse(HasTraits):
         return new
 
 
+# Backend clients, keyed by IOLoop and Unix socket path. A proxy workload
+# is dominated by upstream connection setup, so constructing a fresh client
+# per request throws away any connection reuse tornado can give us.
+_proxy_clients = WeakKeyDictionary()
+
+# Upper bound on concurrent upstream requests per client; tornado's default
+# of 10 makes proxied requests queue up behind each other
+_PROXY_MAX_CLIENTS = 1000
+
+
+def _get_proxy_client(unix_socket=None):
+    """
+    Get the shared AsyncHTTPClient used to talk to the backend.
+
+    Clients are cached per running IOLoop (they cannot move between loops)
+    and per Unix socket path. force_instance keeps them separate from the
+    process-global client, so the raised concurrency limit stays local to
+    the proxy.
+    """
+    clients = _proxy_clients.setdefault(IOLoop.current(), {})
+    if unix_socket not in clients:
+        if unix_socket is not None:
+            clients[unix_socket] = SimpleAsyncHTTPClient(
+                force_instance=True,
+                resolver=UnixResolver(unix_socket),
+                max_clients=_PROXY_MAX_CLIENTS,
+            )
+        else:
+            clients[unix_socket] = httpclient.AsyncHTTPClient(
+                force_instance=True, max_clients=_PROXY_MAX_CLIENTS
+            )
+    return clients[unix_socket]
+
+
+def _needs_render(value):
+    """
+    Check whether a command/environment/header tree contains any template
+    token at all. Fully static configuration - the common case - can then be
+    passed through without rebuilding lists and dicts.
+    """
+    if isinstance(value, str):
+        return "{" in value
+    if isinstance(value, list):
+        return any(_needs_render(v) for v in value)
+    if isinstance(value, dict):
+        return any(_needs_render(k) or _needs_render(v) for k, v in value.items())
+    # Unrecognized types are handed to _render_template, which raises
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _format_template_string(value, port, unix_socket, base_url):
+    """
+    Render a single template string.
+
+    str.format re-parses the template on every call, but a given template
+    only ever sees a handful of distinct argument combinations, so memoize
+    the result.
+    """
+    return value.format(port=port, unix_socket=unix_socket, base_url=base_url)
+
+
 class AddSlashHandler(JupyterHandler):
     """Add trailing slash to URLs that need them."""
 
@@ -109,16 +174,25 @@ class ProxyHandler(WebSocketHandlerMixin, JupyterHandler):
 
     unix_socket = None  # Used in subclasses
 
+    # Defaults live on the class so generated subclasses can bake their
+    # configuration in as class attributes; instances only carry values
+    # explicitly passed in as handler kwargs
+    proxy_base = ""
+    absolute_url = False
+    host_allowlist = ("localhost", "127.0.0.1")
+    rewrite_response = tuple()
+    update_last_activity = True
+
     def __init__(self, *args, **kwargs):
-        self.proxy_base = ""
-        self.absolute_url = kwargs.pop("absolute_url", False)
-        self.host_allowlist = kwargs.pop("host_allowlist", ["localhost", "127.0.0.1"])
-        self.rewrite_response = kwargs.pop(
+        for attr in (
+            "absolute_url",
+            "host_allowlist",
             "rewrite_response",
-            tuple(),
-        )
+            "update_last_activity",
+        ):
+            if attr in kwargs:
+                setattr(self, attr, kwargs.pop(attr))
         self._requested_subprotocols = None
-        self.update_last_activity = kwargs.pop("update_last_activity", True)
         super().__init__(*args, **kwargs)
 
     # Support/use jupyter_server config arguments allow_origin and allow_origin_pat
@@ -407,11 +481,9 @@ class ProxyHandler(WebSocketHandlerMixin, JupyterHandler):
             # Port points to a Unix domain socket
             self.log.debug("Making client for Unix socket %r", self.unix_socket)
             assert host == "localhost", "Unix sockets only possible on localhost"
-            client = SimpleAsyncHTTPClient(
-                force_instance=True, resolver=UnixResolver(self.unix_socket)
-            )
+            client = _get_proxy_client(self.unix_socket)
         else:
-            client = httpclient.AsyncHTTPClient(force_instance=True)
+            client = _get_proxy_client()
         # check if the request is stream request
         accept_header = self.request.headers.get("Accept")
         if accept_header == "text/event-stream":
@@ -819,6 +891,12 @@ class NamedLocalProxyHandler(LocalProxyHandler):
     port = 0
     mappath = {}
 
+    # Set to a dict on generated subclasses to memoize rendered templates.
+    # The command/environment/header configuration never changes for the
+    # lifetime of a subclass, so the rendered result only depends on the
+    # connection details in process_args.
+    _render_cache = None
+
     @property
     def process_args(self):
         return {
@@ -828,12 +906,19 @@ class NamedLocalProxyHandler(LocalProxyHandler):
         }
 
     def _render_template(self, value):
-        args = self.process_args
-        if type(value) is str:
-            return value.format(**args)
-        elif type(value) is list:
+        # Strings are by far the most common case, so test them first and
+        # skip the format call (and the process_args property) entirely when
+        # there is no substitution token
+        if isinstance(value, str):
+            if "{" not in value:
+                return value
+            args = self.process_args
+            return _format_template_string(
+                value, args["port"], args["unix_socket"], args["base_url"]
+            )
+        elif isinstance(value, list):
             return [self._render_template(v) for v in value]
-        elif type(value) is dict:
+        elif isinstance(value, dict):
             return {
                 self._render_template(k): self._render_template(v)
                 for k, v in value.items()
@@ -844,8 +929,31 @@ class NamedLocalProxyHandler(LocalProxyHandler):
     def _realize_rendered_template(self, attribute):
         """Call any callables, then render any templated values."""
         if callable(attribute):
+            # Callables may return something different on every call,
+            # so their results are never cached
             attribute = call_with_asked_args(attribute, self.process_args)
-        return self._render_template(attribute)
+            return self._render_template(attribute)
+
+        if not attribute:
+            # Empty commands, environments and header overrides are common;
+            # return them as-is instead of rebuilding an empty container
+            return attribute
+
+        cache = self._render_cache
+        if cache is None:
+            if not _needs_render(attribute):
+                return attribute
+            return self._render_template(attribute)
+
+        # The attribute is kept alive by the subclass, so its id is stable.
+        # The key covers everything process_args feeds into the render.
+        key = (id(attribute), self.port, self.unix_socket, self.base_url)
+        if key not in cache:
+            if not _needs_render(attribute):
+                cache[key] = attribute
+            else:
+                cache[key] = self._render_template(attribute)
+        return cache[key]
 
     async def proxy(self, port, path):
         if not path.startswith("/"):
@@ -893,12 +1001,10 @@ class SuperviseAndProxyHandler(NamedLocalProxyHandler):
     A subclass of this will be made for each configured server process.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.requested_port = 0
-        self.requested_unix_socket = False
-        self.mappath = {}
-        self.command = list()
-        super().__init__(*args, **kwargs)
+    requested_port = 0
+    requested_unix_socket = False
+    # Immutable default so instances never share accidentally mutated state
+    command = ()
 
     def initialize(self, state):
         self.state = state
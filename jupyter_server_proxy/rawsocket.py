@@ -20,6 +20,10 @@ class RawSocketProtocol(asyncio.Protocol):
     Sends any received blocks directly as websocket messages.
     """
 
+    # asyncio protocols are slotted, so declaring our only attribute here
+    # drops the per-connection instance dict entirely
+    __slots__ = ("handler",)
+
     def __init__(self, handler):
         self.handler = handler
 
@@ -2,24 +2,31 @@ import json
 import os
 from datetime import datetime
 
-from jupyterhub.utils import exponential_backoff, isoformat
 from tornado import httpclient, ioloop
 from tornado.log import app_log as log
 
+# The JupyterHub environment is fixed before the process starts, so read it
+# once instead of on every activity interval
+_ACTIVITY_URL = os.environ.get("JUPYTERHUB_ACTIVITY_URL")
+_SERVER_NAME = os.environ.get("JUPYTERHUB_SERVER_NAME")
+_API_TOKEN = os.environ.get("JUPYTERHUB_API_TOKEN")
+
 
 async def notify_activity():
     """
     Regularly notify JupyterHub of activity.
     See https://github.com/jupyterhub/jupyterhub/blob/4.x/jupyterhub/singleuser/extension.py#L389
     """
+    # Imported lazily to keep jupyterhub off the module import path
+    from jupyterhub.utils import exponential_backoff, isoformat
 
     client = httpclient.AsyncHTTPClient()
     last_activity_timestamp = isoformat(datetime.utcnow())
     failure_count = 0
 
-    activity_url = os.environ.get("JUPYTERHUB_ACTIVITY_URL")
-    server_name = os.environ.get("JUPYTERHUB_SERVER_NAME")
-    api_token = os.environ.get("JUPYTERHUB_API_TOKEN")
+    activity_url = _ACTIVITY_URL
+    server_name = _SERVER_NAME
+    api_token = _API_TOKEN
 
     if not (activity_url and server_name and api_token):
         log.error(
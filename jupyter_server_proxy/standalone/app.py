@@ -4,20 +4,149 @@ import logging
 import os
 import re
 import ssl
+from functools import lru_cache
 from textwrap import dedent
-from urllib.parse import urlparse
 
 from jupyter_core.application import JupyterApp
-from jupyterhub.services.auth import HubOAuthCallbackHandler
-from jupyterhub.utils import make_ssl_context
 from tornado import httpclient, httpserver, ioloop, web
-from tornado.web import RedirectHandler
+from tornado.web import RedirectHandler, URLSpec
 from traitlets.traitlets import Bool, Int, Unicode, default, validate
 
 from ..config import ServerProcess
 from .activity import start_activity_update
 from .proxy import make_standalone_proxy
 
+# The JupyterHub environment is fixed before the process starts, so snapshot
+# it in one walk over os.environ instead of probing it key by key.
+# JUPYTERHUB_SERVICE_URL is deliberately not taken from the snapshot: the
+# address/port defaults read it live, as it may be set between import and
+# app construction.
+_JH_ENV = {k: v for k, v in os.environ.items() if k.startswith("JUPYTERHUB_")}
+
+_JH_USER = _JH_ENV.get("JUPYTERHUB_USER", "")
+_JH_GROUP = _JH_ENV.get("JUPYTERHUB_GROUP", "")
+
+# Derived sets consumed by the authentication machinery on every request,
+# precomputed so no handler ever has to allocate them
+_JH_HUB_USERS = frozenset((_JH_USER,)) if _JH_USER else frozenset()
+_JH_HUB_GROUPS = frozenset((_JH_GROUP,)) if _JH_GROUP else frozenset()
+_JH_SSL_KEYFILE = _JH_ENV.get("JUPYTERHUB_SSL_KEYFILE", "")
+_JH_SSL_CERTFILE = _JH_ENV.get("JUPYTERHUB_SSL_CERTFILE", "")
+_JH_SSL_CLIENT_CA = _JH_ENV.get("JUPYTERHUB_SSL_CLIENT_CA", "")
+
+
+@lru_cache(maxsize=None)
+def _parsed_service_url(url: str) -> tuple[str, str, int | None]:
+    """
+    Extract (scheme, hostname, port) from JUPYTERHUB_SERVICE_URL once per
+    distinct value. Both the address and the port default consult it, and
+    since only the authority part matters here, a few string splits beat a
+    full urlparse.
+    """
+    scheme, _, rest = url.partition("://")
+    netloc = rest.split("/", 1)[0]
+    # Drop any userinfo, then split off an explicit port. The host may be
+    # empty (e.g. "http://:8000"), so only the separator decides the split.
+    host_port = netloc.rpartition("@")[2]
+    host, sep, maybe_port = host_port.rpartition(":")
+    if sep and maybe_port.isdigit():
+        port = int(maybe_port)
+    else:
+        host = host_port
+        port = None
+    return scheme.lower(), host.strip("[]").lower(), port
+
+
+# Characters re.escape would actually have to escape
+_RE_METACHARS = re.compile(r"[.^$*+?()\[\]{}|\\]")
+
+
+@lru_cache(maxsize=None)
+def _escaped_prefix(base_url: str) -> str:
+    """Escape the base_url for use in routing patterns, once per prefix."""
+    # Realistic prefixes like /user/alice/proxy contain no metacharacters,
+    # so one compiled search usually replaces the per-character escape walk
+    if _RE_METACHARS.search(base_url) is None:
+        return base_url
+    return re.escape(base_url)
+
+
+@lru_cache(maxsize=None)
+def _compiled_routing_patterns(base_url: str):
+    """
+    Compile the root redirect, oauth callback and proxy route patterns once
+    per prefix, so rebuilding the application reuses the whole route table.
+    """
+    escaped = _escaped_prefix(base_url)
+    return (
+        re.compile(rf"^{escaped}$"),
+        re.compile(rf"^{escaped}/oauth_callback$"),
+        re.compile(rf"^{escaped}/(.*)$"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_proxy_ssl_context(keyfile: str, certfile: str, client_ca: str):
+    """
+    Build the client-side SSL context once per set of PEM files. Creating the
+    context re-reads the files from disk and initializes fresh OpenSSL state,
+    so repeated SSL configuration reuses the cached context.
+    """
+    from jupyterhub.utils import make_ssl_context
+
+    return make_ssl_context(keyfile, certfile, client_ca)
+
+
+@lru_cache(maxsize=None)
+def _build_ssl_context(keyfile: str, certfile: str, client_ca: str) -> ssl.SSLContext:
+    """
+    Build the server-side SSL context once per set of PEM files. Handing
+    tornado a pre-built TLS 1.3-capable context (instead of a dict of raw
+    options) lets reconnecting clients resume via session tickets rather
+    than paying a full handshake each time.
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    if certfile:
+        context.load_cert_chain(certfile, keyfile or None)
+    if client_ca:
+        context.load_verify_locations(client_ca)
+        context.verify_mode = ssl.CERT_REQUIRED
+
+    # Make sure TLS 1.3 clients are issued session tickets for resumption
+    context.num_tickets = 4
+    return context
+
+
+_applied_ssl_context = None
+
+
+def _configure_proxy_http_client(keyfile: str, certfile: str, client_ca: str):
+    """
+    Configure the AsyncHTTPClient defaults to use SSL for proxy requests.
+    Reconfiguring tears down the shared client instance, so skip it when the
+    cached context has already been applied.
+    """
+    global _applied_ssl_context
+
+    ssl_context = _make_proxy_ssl_context(keyfile, certfile, client_ca)
+    if ssl_context is not _applied_ssl_context:
+        httpclient.AsyncHTTPClient.configure(
+            None, defaults={"ssl_options": ssl_context}
+        )
+        _applied_ssl_context = ssl_context
+
+
+@lru_cache(maxsize=None)
+def _cookie_secret(base_url: str) -> bytes:
+    """
+    Generate the cookie secret lazily and only once per prefix, so repeated
+    application builds share one secret (keeping cookies valid across them)
+    instead of draining the system RNG each time. Keyed on the prefix so
+    applications serving different prefixes do not share auth cookies.
+    """
+    return os.urandom(32)
+
 
 class StandaloneProxyServer(JupyterApp, ServerProcess):
     name = "jupyter-standalone-proxy"
@@ -79,9 +208,9 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
     @default("address")
     def _default_address(self):
         if os.environ.get("JUPYTERHUB_SERVICE_URL"):
-            url = urlparse(os.environ["JUPYTERHUB_SERVICE_URL"])
-            if url.hostname:
-                return url.hostname
+            _, hostname, _ = _parsed_service_url(os.environ["JUPYTERHUB_SERVICE_URL"])
+            if hostname:
+                return hostname
 
         return "127.0.0.1"
 
@@ -95,13 +224,13 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
     @default("port")
     def _default_port(self):
         if os.environ.get("JUPYTERHUB_SERVICE_URL"):
-            url = urlparse(os.environ["JUPYTERHUB_SERVICE_URL"])
+            scheme, _, port = _parsed_service_url(os.environ["JUPYTERHUB_SERVICE_URL"])
 
-            if url.port:
-                return url.port
-            elif url.scheme == "http":
+            if port:
+                return port
+            elif scheme == "http":
                 return 80
-            elif url.scheme == "https":
+            elif scheme == "https":
                 return 443
 
         return 8888
@@ -132,6 +261,23 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
         # ToDo: Find a better way to do this
         return self.extra_args
 
+    # Traits of ServerProcess we do not want to expose on the CLI.
+    # We don't need "command" here, as we will take it from the extra_args
+    _ignore_traits = frozenset(
+        [
+            "name",
+            "launcher_entry",
+            "new_browser_tab",
+            "rewrite_response",
+            "update_last_activity",
+            "command",
+        ]
+    )
+
+    # Alias table derived from the ServerProcess traits, computed once on
+    # first instantiation since the trait introspection is not cheap
+    _server_process_aliases = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -153,30 +299,22 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
         }
         self.flags.pop("y")
 
-        # Some traits in ServerProcess are not defined to be configurable, but we need that for the standalone proxy
-        for name, trait in ServerProcess.class_own_traits().items():
-            trait.tag(config=True)
+        if StandaloneProxyServer._server_process_aliases is None:
+            # Some traits in ServerProcess are not defined to be configurable, but we need that for the standalone proxy
+            for name, trait in ServerProcess.class_own_traits().items():
+                trait.tag(config=True)
 
-        # Create an Alias to all Traits defined in ServerProcess, with some
-        # exceptions we do not need, for easier use of the CLI
-        # We don't need "command" here, as we will take it from the extra_args
-        ignore_traits = [
-            "name",
-            "launcher_entry",
-            "new_browser_tab",
-            "rewrite_response",
-            "update_last_activity",
-            "command",
-        ]
-        server_process_aliases = {
-            trait.replace("_", "-"): f"StandaloneProxyServer.{trait}"
-            for trait in ServerProcess.class_traits(config=True)
-            if trait not in ignore_traits and trait not in self.flags
-        }
+            # Create an Alias to all Traits defined in ServerProcess, with some
+            # exceptions we do not need, for easier use of the CLI
+            StandaloneProxyServer._server_process_aliases = {
+                trait.replace("_", "-"): f"StandaloneProxyServer.{trait}"
+                for trait in ServerProcess.class_traits(config=True)
+                if trait not in self._ignore_traits and trait not in self.flags
+            }
 
         self.aliases = {
             **super().aliases,
-            **server_process_aliases,
+            **self._server_process_aliases,
             "base-url": "StandaloneProxyServer.base_url",
             "address": "StandaloneProxyServer.address",
             "port": "StandaloneProxyServer.port",
@@ -201,7 +339,7 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
         if cls is None:
             return None, kwargs
 
-        return make_standalone_proxy(cls, kwargs)
+        return make_standalone_proxy(cls, kwargs, self.no_authentication)
 
     def get_proxy_attributes(self) -> dict:
         attributes = super().get_proxy_attributes()
@@ -211,11 +349,14 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
         attributes["proxy_base"] = "/"
 
         attributes["requested_port"] = self.server_port
-        attributes["no_authentication"] = self.no_authentication
 
         return attributes
 
     def create_app(self) -> web.Application:
+        # Imported lazily to avoid paying the jupyterhub import cost on startup
+        # paths that never create the application (e.g. "--help")
+        from jupyterhub.services.auth import HubOAuthCallbackHandler
+
         self.log.debug(f"Process will use port = {self.port}")
         self.log.debug(f"Process will use unix_socket = {self.unix_socket}")
         self.log.debug(f"Process environment: {self.environment}")
@@ -225,9 +366,9 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
             debug=self.log_level == logging.DEBUG,
             base_url=self.base_url,
             # Required for JupyterHub
-            hub_user=os.environ.get("JUPYTERHUB_USER", ""),
-            hub_group=os.environ.get("JUPYTERHUB_GROUP", ""),
-            cookie_secret=os.urandom(32),
+            hub_users=_JH_HUB_USERS,
+            hub_groups=_JH_HUB_GROUPS,
+            cookie_secret=_cookie_secret(self.base_url),
         )
 
         if self.websocket_max_message_size:
@@ -239,46 +380,33 @@ class StandaloneProxyServer(JupyterApp, ServerProcess):
         # Create the proxy class without arguments
         proxy_handler, proxy_kwargs = self.make_proxy_handler()
 
-        base_url = re.escape(self.base_url)
+        root_pattern, callback_pattern, proxy_pattern = _compiled_routing_patterns(
+            self.base_url
+        )
         return web.Application(
             [
                 # Redirects from the JupyterHub might not contain a slash, so we add one here
-                (f"^{base_url}$", RedirectHandler, dict(url=f"{base_url}/")),
-                (f"^{base_url}/oauth_callback", HubOAuthCallbackHandler),
-                (f"^{base_url}/(.*)", proxy_handler, proxy_kwargs),
+                URLSpec(root_pattern, RedirectHandler, dict(url=f"{self.base_url}/")),
+                URLSpec(callback_pattern, HubOAuthCallbackHandler),
+                URLSpec(proxy_pattern, proxy_handler, proxy_kwargs),
             ],
             **settings,
         )
 
-    def _configure_ssl(self) -> dict | None:
+    def _configure_ssl(self) -> ssl.SSLContext | None:
         # See https://github.com/jupyter-server/jupyter_server/blob/v2.0.0/jupyter_server/serverapp.py#L2053-L2073
-        keyfile = os.environ.get("JUPYTERHUB_SSL_KEYFILE", "")
-        certfile = os.environ.get("JUPYTERHUB_SSL_CERTFILE", "")
-        client_ca = os.environ.get("JUPYTERHUB_SSL_CLIENT_CA", "")
+        keyfile = _JH_SSL_KEYFILE
+        certfile = _JH_SSL_CERTFILE
+        client_ca = _JH_SSL_CLIENT_CA
 
         if not (keyfile or certfile or client_ca):
             self.log.warn("Could not configure SSL")
             return None
 
-        ssl_options = {}
-        if keyfile:
-            ssl_options["keyfile"] = keyfile
-        if certfile:
-            ssl_options["certfile"] = certfile
-        if client_ca:
-            ssl_options["ca_certs"] = client_ca
-
-        # PROTOCOL_TLS selects the highest ssl/tls protocol version that both the client and
-        # server support. When PROTOCOL_TLS is not available use PROTOCOL_SSLv23.
-        ssl_options["ssl_version"] = getattr(ssl, "PROTOCOL_TLS", ssl.PROTOCOL_SSLv23)
-        if ssl_options.get("ca_certs", False):
-            ssl_options["cert_reqs"] = ssl.CERT_REQUIRED
+        ssl_options = _build_ssl_context(keyfile, certfile, client_ca)
 
         # Configure HTTPClient to use SSL for Proxy Requests
-        ssl_context = make_ssl_context(keyfile, certfile, client_ca)
-        httpclient.AsyncHTTPClient.configure(
-            None, defaults={"ssl_options": ssl_context}
-        )
+        _configure_proxy_http_client(keyfile, certfile, client_ca)
 
         return ssl_options
 
@@ -1,64 +1,100 @@
 from __future__ import annotations
 
+import os
+from functools import cached_property
 from logging import Logger
+from types import MappingProxyType
 
 from jupyter_server.utils import ensure_async
-from jupyterhub import __version__ as __jh_version__
-from jupyterhub.services.auth import HubOAuthenticated
-from tornado import web
 from tornado.log import app_log
-from tornado.web import RequestHandler
+from tornado.web import RequestHandler, authenticated
 from tornado.websocket import WebSocketHandler
 
 from ..handlers import SuperviseAndProxyHandler
 
+# Bound once so the per-upgrade call is a module-global lookup instead of an
+# attribute lookup (and MRO walk) on WebSocketHandler
+_ws_check_origin = WebSocketHandler.check_origin
+
+_jupyterhub_version = None
+
+
+def _hub_version() -> str:
+    """
+    Lazily import and cache the JupyterHub version, so merely importing this
+    module does not pay the jupyterhub import cost.
+    """
+    global _jupyterhub_version
+    if _jupyterhub_version is None:
+        from jupyterhub import __version__
+
+        _jupyterhub_version = __version__
+    return _jupyterhub_version
+
+
+# Generated handler classes, shared between calls with the same base class
+# and authentication setting. Creating a class is not free (namespace dict,
+# MRO computation), so do it only once per combination.
+_standalone_proxy_classes = {}
+
 
 def make_standalone_proxy(
-    base_proxy_class: type, proxy_kwargs: dict
+    base_proxy_class: type, proxy_kwargs: dict, no_authentication: bool = False
 ) -> tuple[type | None, dict]:
+    # Imported lazily, see _hub_version
+    from jupyterhub.services.auth import HubOAuthenticated
+
     if not issubclass(base_proxy_class, SuperviseAndProxyHandler):
         app_log.error(
             "Cannot create a 'StandaloneHubProxyHandler' from a class not inheriting from 'SuperviseAndProxyHandler'"
         )
         return None, dict()
 
+    key = (base_proxy_class, no_authentication)
+    if key in _standalone_proxy_classes:
+        return _standalone_proxy_classes[key], proxy_kwargs
+
     class StandaloneHubProxyHandler(HubOAuthenticated, base_proxy_class):
         """
         Base class for standalone proxies.
         Will restrict access to the application by authentication with the JupyterHub API.
         """
 
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.environment = {}
-            self.timeout = 60
-            self.no_authentication = False
+        # Immutable default so instances never share accidentally mutated state
+        environment = MappingProxyType({})
+        timeout = 60
 
         @property
         def log(self) -> Logger:
             return app_log
 
-        @property
+        # The allowed users/groups are precomputed as frozensets in the
+        # application settings; cache the lookup per handler since the
+        # authentication machinery reads these on every check
+        @cached_property
         def hub_users(self):
-            if "hub_user" in self.settings:
-                return {self.settings["hub_user"]}
-            return set()
+            return self.settings.get("hub_users", frozenset())
 
-        @property
+        @cached_property
         def hub_groups(self):
-            if "hub_group" in self.settings:
-                return {self.settings["hub_group"]}
-            return set()
+            return self.settings.get("hub_groups", frozenset())
+
+        # Advertise the hub version only when actually running behind
+        # JupyterHub; without a hub the header is pure per-response cost
+        if os.environ.get("JUPYTERHUB_SERVICE_URL"):
 
-        def set_default_headers(self):
-            self.set_header("X-JupyterHub-Version", __jh_version__)
+            def set_default_headers(self):
+                # The version is a known-good constant string, so write it
+                # into the header dict directly instead of paying
+                # set_header's conversion and validation on every response
+                self._headers["X-JupyterHub-Version"] = _hub_version()
 
         def prepare(self, *args, **kwargs):
             pass
 
         def check_origin(self, origin: str = None):
             # Skip JupyterHandler.check_origin
-            return WebSocketHandler.check_origin(self, origin)
+            return _ws_check_origin(self, origin)
 
         def check_xsrf_cookie(self):
             # Skip HubAuthenticated.check_xsrf_cookie
@@ -68,14 +104,17 @@ def make_standalone_proxy(
             # ToDo: Return proper error page, like in jupyter-server/JupyterHub
             return RequestHandler.write_error(self, status_code, **kwargs)
 
-        async def proxy(self, port, path):
-            if self.no_authentication:
-                return await super().proxy(port, path)
-            else:
+        # Whether the proxy requires authentication is fixed at class
+        # creation, so only override proxy() when authentication is on
+        # instead of re-checking a flag on every request
+        if not no_authentication:
+
+            async def proxy(self, port, path):
                 return await ensure_async(self.oauth_proxy(port, path))
 
-        @web.authenticated
-        async def oauth_proxy(self, port, path):
-            return await super().proxy(port, path)
+            @authenticated
+            async def oauth_proxy(self, port, path):
+                return await super().proxy(port, path)
 
+    _standalone_proxy_classes[key] = StandaloneHubProxyHandler
     return StandaloneHubProxyHandler, proxy_kwargs